@@ -17,29 +17,74 @@ Example:
     ...             framework="example-framework"
     ...         )
     ...     def get_supported_formats(self):
-    ...         return ['.txt', '.md']
+    ...         return frozenset({'.txt', '.md'})
+
+For bulk emission, frameworks can build plain ``UnifiedAnalysisDict`` /
+``ChunkInfoDict`` dicts and wrap them on demand with ``from_dict()``.
 """
 
 __version__ = "1.0.0"
 
-from .interfaces import BaseAnalyzer, BaseChunker
-from .models import UnifiedAnalysisResult, ChunkInfo
-from .exceptions import (
-    FrameworkError,
-    UnsupportedFormatError,
-    AnalysisError,
-    ChunkingError,
-)
-from .constants import ChunkStrategy
+import importlib
+
+# Spelled out rather than imported so that this module does not pull in typing.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .interfaces import BaseAnalyzer, BaseChunker, MemoizedAnalyzer
+    from .models import UnifiedAnalysisResult, ChunkInfo, UnifiedAnalysisDict, ChunkInfoDict
+    from .exceptions import (
+        FrameworkError,
+        UnsupportedFormatError,
+        AnalysisError,
+        ChunkingError,
+    )
+    from .constants import ChunkStrategy, ChunkStrategyId
+
+# Public names and the submodule defining each. Submodules are imported on
+# first attribute access (PEP 562) so that importing the package stays cheap.
+_LAZY = {
+    "BaseAnalyzer": "interfaces",
+    "BaseChunker": "interfaces",
+    "MemoizedAnalyzer": "interfaces",
+    "UnifiedAnalysisResult": "models",
+    "ChunkInfo": "models",
+    "UnifiedAnalysisDict": "models",
+    "ChunkInfoDict": "models",
+    "FrameworkError": "exceptions",
+    "UnsupportedFormatError": "exceptions",
+    "AnalysisError": "exceptions",
+    "ChunkingError": "exceptions",
+    "ChunkStrategy": "constants",
+    "ChunkStrategyId": "constants",
+}
 
 __all__ = [
     "BaseAnalyzer",
     "BaseChunker",
+    "MemoizedAnalyzer",
     "UnifiedAnalysisResult",
     "ChunkInfo",
+    "UnifiedAnalysisDict",
+    "ChunkInfoDict",
     "FrameworkError",
     "UnsupportedFormatError",
     "AnalysisError",
     "ChunkingError",
     "ChunkStrategy",
+    "ChunkStrategyId",
 ]
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(_LAZY))
@@ -5,9 +5,42 @@ This module defines standard constants used across frameworks,
 particularly for chunking strategies.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum, unique
+from typing import Dict, Tuple, Union
 
 
+@unique
+class ChunkStrategyId(IntEnum):
+    """
+    Integer ids for the standard chunking strategies.
+
+    Ids are dense and follow ChunkStrategy's declaration order, so a
+    dispatcher can keep one handler per strategy in a list and index it with
+    ``strategy.id`` instead of hashing the strategy name.
+
+    Example:
+        >>> handlers = [chunk_auto, chunk_hierarchical, ...]  # one per id
+        >>> handlers[ChunkStrategy.HIERARCHICAL.id] is chunk_hierarchical
+        True
+        >>> ChunkStrategyId.HIERARCHICAL.strategy
+        <ChunkStrategy.HIERARCHICAL: 'hierarchical'>
+    """
+
+    AUTO = 0
+    HIERARCHICAL = 1
+    SLIDING_WINDOW = 2
+    CONTENT_AWARE = 3
+    STRUCTURAL = 4
+    TABLE_AWARE = 5
+    PAGE_AWARE = 6
+
+    @property
+    def strategy(self) -> "ChunkStrategy":
+        """The ChunkStrategy member with this id."""
+        return _STRATEGIES[self]
+
+
+@unique
 class ChunkStrategy(str, Enum):
     """
     Standard chunking strategy names.
@@ -42,3 +75,48 @@ class ChunkStrategy(str, Enum):
     STRUCTURAL = "structural"
     TABLE_AWARE = "table_aware"
     PAGE_AWARE = "page_aware"
+
+    _id: ChunkStrategyId
+
+    @property
+    def id(self) -> ChunkStrategyId:
+        """
+        Dense integer id of this strategy, for indexing per-strategy tables.
+
+        Example:
+            >>> ChunkStrategy.AUTO.id
+            <ChunkStrategyId.AUTO: 0>
+        """
+        return self._id
+
+    @classmethod
+    def coerce(cls, value: str) -> Union["ChunkStrategy", str]:
+        """
+        Map a strategy name to its enum member with a single dict lookup.
+
+        Cheaper than ``ChunkStrategy(value)``, which goes through
+        ``EnumMeta.__call__``. Names that are not standard strategies are
+        returned unchanged, since frameworks may define their own.
+
+        Args:
+            value: Strategy name or ChunkStrategy member
+
+        Returns:
+            The matching ChunkStrategy member, or ``value`` if there is none
+
+        Example:
+            >>> ChunkStrategy.coerce("hierarchical")
+            <ChunkStrategy.HIERARCHICAL: 'hierarchical'>
+            >>> ChunkStrategy.coerce("paragraph")
+            'paragraph'
+        """
+        return _STRATEGY_LOOKUP.get(value, value)
+
+
+_STRATEGY_LOOKUP: Dict[str, ChunkStrategy] = {member.value: member for member in ChunkStrategy}
+
+# Indexed by ChunkStrategyId; the two enums must declare members in the same order.
+_STRATEGIES: Tuple[ChunkStrategy, ...] = tuple(ChunkStrategy)
+for _member in ChunkStrategy:
+    _member._id = ChunkStrategyId[_member.name]
+del _member
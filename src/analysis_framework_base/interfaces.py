@@ -2,11 +2,16 @@
 Abstract base classes defining the interface for analysis frameworks.
 
 This module provides BaseAnalyzer and BaseChunker interfaces that all
-specialized frameworks must implement to ensure consistency.
+specialized frameworks must implement to ensure consistency, plus
+MemoizedAnalyzer, a BaseAnalyzer that caches results per file version.
 """
 
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, FrozenSet, Hashable, List, Optional, Sequence
 
 from .models import UnifiedAnalysisResult, ChunkInfo
 
@@ -27,8 +32,10 @@ class BaseAnalyzer(ABC):
         ...             framework="my-framework"
         ...         )
         ...
-        ...     def get_supported_formats(self) -> List[str]:
-        ...         return ['.xml', '.pdf']
+        ...     SUPPORTED_FORMATS: ClassVar[FrozenSet[str]] = frozenset({'.xml', '.pdf'})
+        ...
+        ...     def get_supported_formats(self) -> FrozenSet[str]:
+        ...         return self.SUPPORTED_FORMATS
     """
 
     @abstractmethod
@@ -50,17 +57,159 @@ class BaseAnalyzer(ABC):
         pass
 
     @abstractmethod
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> FrozenSet[str]:
+        """
+        Return the set of supported file extensions.
+
+        Implementations should return the same frozenset on every call (for
+        example a ``SUPPORTED_FORMATS`` class attribute), so callers can test
+        membership with a hash lookup and no per-call allocation.
+
+        Returns:
+            Frozenset of extensions like frozenset({'.xml', '.pdf', '.docx'})
+
+        Example:
+            >>> analyzer = MyAnalyzer()
+            >>> '.pdf' in analyzer.get_supported_formats()
+            True
+        """
+        pass
+
+    def analyze_batch(
+        self, file_paths: Sequence[str], *, max_workers: Optional[int] = None, **kwargs
+    ) -> List[UnifiedAnalysisResult]:
         """
-        Return list of supported file extensions.
+        Analyze several documents, returning results in input order.
+
+        The default implementation runs ``analyze_unified()`` on a thread pool,
+        which overlaps file I/O and any work that releases the GIL. Analyzers
+        that can batch their I/O or processing natively should override it.
+        ``analyze_unified()`` must be safe to call from multiple threads.
+
+        Args:
+            file_paths: Paths of files to analyze
+            max_workers: Thread count; defaults to min(32, len(file_paths)).
+                Use 1 to analyze sequentially in the calling thread.
+            **kwargs: Framework-specific options passed to every call
 
         Returns:
-            List of extensions like ['.xml', '.pdf', '.docx']
+            List of UnifiedAnalysisResult, one per path
+
+        Raises:
+            UnsupportedFormatError: A file format is not supported
+            AnalysisError: An analysis failed
 
         Example:
             >>> analyzer = MyAnalyzer()
-            >>> analyzer.get_supported_formats()
-            ['.xml', '.pdf', '.docx']
+            >>> results = analyzer.analyze_batch(['a.xml', 'b.pdf'], max_workers=4)
+            >>> len(results)
+            2
+        """
+        paths = list(file_paths)
+        workers = max_workers or min(32, len(paths))
+        if workers <= 1 or len(paths) <= 1:
+            return [self.analyze_unified(path, **kwargs) for path in paths]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda path: self.analyze_unified(path, **kwargs), paths))
+
+
+class MemoizedAnalyzer(BaseAnalyzer):
+    """
+    BaseAnalyzer that caches analyze_unified() results per file version.
+
+    Results are kept in an LRU cache keyed on the absolute path, the file's
+    modification time and size, and the keyword arguments, so a cached result
+    is reused only while the file is unchanged. Subclasses implement
+    ``_compute()`` instead of ``analyze_unified()``. Calls whose keyword
+    arguments are unhashable, or whose file cannot be stat'ed, bypass the cache.
+
+    Cached results are shared between callers, which is safe because
+    UnifiedAnalysisResult is immutable.
+
+    Example:
+        >>> class MyAnalyzer(MemoizedAnalyzer):
+        ...     def _compute(self, file_path: str, **kwargs) -> UnifiedAnalysisResult:
+        ...         return UnifiedAnalysisResult(
+        ...             document_type="My Document Type",
+        ...             confidence=0.95,
+        ...             framework="my-framework"
+        ...         )
+        ...
+        ...     def get_supported_formats(self) -> FrozenSet[str]:
+        ...         return frozenset({'.xml'})
+        >>> analyzer = MyAnalyzer(maxsize=256)
+        >>> analyzer.analyze_unified('doc.xml') is analyzer.analyze_unified('doc.xml')
+        True
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Args:
+            maxsize: Maximum number of results to keep
+        """
+        self._cache_maxsize = maxsize
+        self._cache: "OrderedDict[Hashable, UnifiedAnalysisResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def analyze_unified(self, file_path: str, **kwargs) -> UnifiedAnalysisResult:
+        """
+        Analyze a document, reusing the cached result if the file is unchanged.
+
+        Args:
+            file_path: Path to file to analyze
+            **kwargs: Framework-specific options
+
+        Returns:
+            UnifiedAnalysisResult with standard structure
+
+        Raises:
+            UnsupportedFormatError: File format not supported
+            AnalysisError: Analysis failed
+        """
+        try:
+            stat = os.stat(file_path)
+            key: Hashable = (
+                os.path.abspath(file_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                frozenset(kwargs.items()),
+            )
+        except (OSError, TypeError):
+            return self._compute(file_path, **kwargs)
+
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                return result
+
+        result = self._compute(file_path, **kwargs)
+        with self._cache_lock:
+            self._cache[key] = result
+            while len(self._cache) > self._cache_maxsize:
+                self._cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """Discard all cached results."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @abstractmethod
+    def _compute(self, file_path: str, **kwargs: Any) -> UnifiedAnalysisResult:
+        """
+        Perform the actual analysis; called on cache misses.
+
+        Args:
+            file_path: Path to file to analyze
+            **kwargs: Framework-specific options
+
+        Returns:
+            UnifiedAnalysisResult with standard structure
+
+        Raises:
+            UnsupportedFormatError: File format not supported
+            AnalysisError: Analysis failed
         """
         pass
 
@@ -90,8 +239,10 @@ class BaseChunker(ABC):
         ...             )
         ...         ]
         ...
-        ...     def get_supported_strategies(self) -> List[str]:
-        ...         return ['auto', 'hierarchical']
+        ...     SUPPORTED_STRATEGIES: ClassVar[FrozenSet[str]] = frozenset({'auto', 'hierarchical'})
+        ...
+        ...     def get_supported_strategies(self) -> FrozenSet[str]:
+        ...         return self.SUPPORTED_STRATEGIES
     """
 
     @abstractmethod
@@ -125,16 +276,50 @@ class BaseChunker(ABC):
         pass
 
     @abstractmethod
-    def get_supported_strategies(self) -> List[str]:
+    def get_supported_strategies(self) -> FrozenSet[str]:
         """
-        Return list of supported chunking strategies.
+        Return the set of supported chunking strategies.
+
+        As with ``BaseAnalyzer.get_supported_formats()``, implementations
+        should return the same frozenset on every call.
 
         Returns:
-            List of strategy names like ['auto', 'hierarchical', 'sliding_window']
+            Frozenset of strategy names like frozenset({'auto', 'hierarchical'})
 
         Example:
             >>> chunker = MyChunker()
-            >>> chunker.get_supported_strategies()
-            ['auto', 'hierarchical', 'sliding_window', 'content_aware']
+            >>> sorted(chunker.get_supported_strategies())
+            ['auto', 'hierarchical']
         """
         pass
+
+    def supports(self, strategy: str) -> bool:
+        """
+        Check whether a chunking strategy is supported.
+
+        The result of ``get_supported_strategies()`` is cached on the concrete
+        class on first use (converted to a frozenset if an older
+        implementation returns a list), so later checks are a single hash
+        lookup. Implementations whose supported strategies vary
+        per instance should override this method.
+
+        Args:
+            strategy: Strategy name or ChunkStrategy member
+
+        Returns:
+            True if the strategy is supported
+
+        Example:
+            >>> chunker = MyChunker()
+            >>> chunker.supports('hierarchical')
+            True
+            >>> chunker.supports(ChunkStrategy.PAGE_AWARE)
+            False
+        """
+        cls = type(self)
+        # Read the class __dict__ directly so subclasses never see a parent's cache.
+        supported = cls.__dict__.get("_supported_strategy_set")
+        if supported is None:
+            supported = frozenset(self.get_supported_strategies())
+            cls._supported_strategy_set = supported  # type: ignore[attr-defined]
+        return strategy in supported
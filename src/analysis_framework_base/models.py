@@ -2,26 +2,528 @@
 Shared data models for analysis frameworks.
 
 This module provides UnifiedAnalysisResult and ChunkInfo dataclasses
-that establish a consistent data format across frameworks.
+that establish a consistent data format across frameworks, and the
+UnifiedAnalysisDict and ChunkInfoDict TypedDicts describing the same
+shapes as plain dicts.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, Optional, List
+import copy
+import json
+import sys
+from dataclasses import (
+    MISSING,
+    FrozenInstanceError,
+    dataclass,
+    field,
+    fields,
+    is_dataclass,
+    replace,
+)
+from datetime import date, time
+from operator import attrgetter
+from types import MappingProxyType, MemberDescriptorType
+from uuid import UUID
+from weakref import WeakValueDictionary
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypedDict,
+    TypeVar,
+    Union,
+    cast,
+)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the optional "json" extra
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
-class UnifiedAnalysisResult:
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the optional "msgspec" extra
+    msgspec = None  # type: ignore[assignment]
+
+_C = TypeVar("_C", bound=type)
+_R = TypeVar("_R", bound="UnifiedAnalysisResult")
+_K = TypeVar("_K", bound="ChunkInfo")
+
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _slotted(cls: Optional[_C] = None, *, weakref_slot: bool = False) -> Any:
+    """
+    Recreate a dataclass with ``__slots__`` for its fields.
+
+    Backport of ``@dataclass(slots=True)``, which requires Python 3.10+.
+    Instances carry no per-instance ``__dict__``, so they are smaller and
+    attribute reads go through slot descriptors. ``weakref_slot=True`` adds a
+    ``__weakref__`` slot so instances can be weakly referenced.
+    """
+
+    def wrap(cls: _C) -> _C:
+        field_names = tuple(f.name for f in fields(cls))
+        cls_dict = dict(cls.__dict__)
+        cls_dict["__slots__"] = field_names + ("__weakref__",) if weakref_slot else field_names
+        for name in field_names:
+            # Defaults are baked into the generated __init__; class attributes
+            # with the same name would conflict with the slot descriptors.
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+        if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            # The generated methods call super() with the original class, which
+            # the rebuilt class's instances are not instances of.
+            cls_dict["__setattr__"] = _frozen_setattr
+            cls_dict["__delattr__"] = _frozen_delattr
+        return cast(_C, type(cls)(cls.__name__, cls.__bases__, cls_dict))
+
+    return wrap if cls is None else wrap(cls)
+
+
+class _FactoryDefault:
+    """Default for parameters whose field has a default_factory."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<factory>"
+
+
+_FACTORY_DEFAULT: Any = _FactoryDefault()
+
+# Factories that the generated __init__ inlines as display literals.
+_FACTORY_LITERALS: Dict[Any, str] = {dict: "{}", list: "[]"}
+
+# Shared default for mapping fields; read-only, so one instance serves all.
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+class _FrozenList(tuple):
+    """
+    Immutable storage for sequence fields that used to hold lists.
+
+    A tuple that also compares equal to a list with the same items, so code
+    written when these fields held caller-supplied lists
+    (``result.ai_opportunities == ["QA"]``) keeps working.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is list:
+            return tuple.__eq__(self, tuple(other))  # type: ignore[no-any-return]
+        return tuple.__eq__(self, other)  # type: ignore[no-any-return]
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_frozen_list, (tuple(self),))
+
+
+def _frozen_list(items: Iterable[Any]) -> "_FrozenList":
+    """Copy ``items`` into a ``_FrozenList``, sharing the empty instance."""
+    if type(items) is _FrozenList:
+        return items
+    if isinstance(items, str):
+        # A str is a Sequence[str] too, but would be split into characters.
+        raise TypeError(f"expected a sequence of strings, not str {items!r}")
+    return _FrozenList(items) or _EMPTY_SEQUENCE
+
+
+_EMPTY_SEQUENCE = _FrozenList()
+
+
+# Results handed out by UnifiedAnalysisResult.get_or_create(), keyed on class
+# and field values; entries disappear once no caller holds the result.
+_INSTANCE_CACHE: "WeakValueDictionary[Any, Any]" = WeakValueDictionary()
+
+
+class _Shared:
+    """
+    default_factory that returns one shared immutable value.
+
+    dataclasses rejects unhashable defaults such as mapping proxies; wrapping
+    them in a factory gets past that check, and ``_fast_init`` binds the value
+    directly as the parameter default so no per-instance work is done.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __call__(self) -> Any:
+        return self.value
+
+
+def _fast_init(
+    interned: Sequence[str] = (),
+    nullable: Sequence[str] = (),
+    **converters: Callable[[Any], Any],
+) -> Callable[[_C], _C]:
+    """
+    Replace a dataclass's generated ``__init__`` with a specialized one.
+
+    The generated code inlines ``{}``/``[]`` for dict/list default factories,
+    uses ``_Shared`` values directly as parameter defaults, and applies
+    ``converters`` (field name -> callable) inline instead of in a separate
+    ``__post_init__`` call. Frozen classes are written through the setters of
+    their slot descriptors, which are C-level struct stores, when applied
+    after ``_slotted``, and through ``object.__setattr__`` otherwise. Fields
+    named in ``interned`` are passed through ``sys.intern`` when they are
+    exact ``str`` instances; these fields hold values from small vocabularies
+    (framework names, chunk types), so interning dedupes them and lets ``==``
+    short-circuit on identity. Fields named in ``nullable`` fall back to
+    their default when passed ``None``.
+    The signature is unchanged, so ``replace()`` and keyword construction
+    keep working.
+
+    The same steps are also installed as an idempotent ``__post_init__``,
+    which the fast ``__init__`` does not call. Subclasses get their own
+    ``__init__`` from ``@dataclass``, which does call it, so their inherited
+    fields are normalized too; a subclass that defines ``__post_init__``
+    must call ``super().__post_init__()``.
+    """
+
+    def decorate(cls: _C) -> _C:
+        frozen = cls.__dataclass_params__.frozen  # type: ignore[attr-defined]
+        namespace: Dict[str, Any] = {
+            "_FACTORY_DEFAULT": _FACTORY_DEFAULT,
+            "_setattr": object.__setattr__,
+            "_intern": sys.intern,
+        }
+        params = ["self"]
+        body = []
+        post_init_body = []
+        for f in fields(cls):
+            name = f.name
+            default_factory: Any = f.default_factory
+            default = default_factory.value if isinstance(default_factory, _Shared) else f.default
+            # Expression for the field's default, or None if it has none.
+            fallback: Optional[str] = None
+            if default is not MISSING:
+                namespace[f"_default_{name}"] = default
+                fallback = f"_default_{name}"
+                params.append(f"{name}={fallback}")
+            elif default_factory is not MISSING:
+                fallback = _FACTORY_LITERALS.get(default_factory)
+                if fallback is None:
+                    namespace[f"_factory_{name}"] = default_factory
+                    fallback = f"_factory_{name}()"
+                params.append(f"{name}=_FACTORY_DEFAULT")
+                body.append(f"if {name} is _FACTORY_DEFAULT: {name} = {fallback}")
+            else:
+                params.append(name)
+
+            steps = []
+            if name in nullable:
+                if fallback is None:
+                    raise ValueError(f"nullable field {name!r} of {cls.__name__} has no default")
+                steps.append(f"if {name} is None: {name} = {fallback}")
+            if name in interned:
+                steps.append(f"if type({name}) is str: {name} = _intern({name})")
+            value = name
+            if name in converters:
+                namespace[f"_convert_{name}"] = converters[name]
+                value = f"_convert_{name}({name})"
+            slot = cls.__dict__.get(name)
+            if frozen and type(slot) is MemberDescriptorType:
+                namespace[f"_set_{name}"] = slot.__set__
+                store = f"_set_{name}(self, {value})"
+            elif frozen:
+                store = f"_setattr(self, {name!r}, {value})"
+            else:
+                store = f"self.{name} = {value}"
+            body += steps
+            body.append(store)
+            if steps or value != name:
+                post_init_body += [f"{name} = self.{name}", *steps, store]
+
+        for source in (
+            f"def __init__({', '.join(params)}):\n" + "".join(f"    {line}\n" for line in body),
+            "def __post_init__(self):\n"
+            + "".join(f"    {line}\n" for line in post_init_body or ["pass"]),
+        ):
+            exec(source, namespace)
+        init = namespace["__init__"]
+        init.__annotations__ = {f.name: f.type for f in fields(cls)}
+        init.__annotations__["return"] = None
+        for method in (init, namespace["__post_init__"]):
+            method.__module__ = cls.__module__
+            method.__qualname__ = f"{cls.__qualname__}.{method.__name__}"
+            setattr(cls, method.__name__, method)
+        return cls
+
+    return decorate
+
+
+class _LazyFieldNames:
+    """
+    Class attribute that resolves to the owner's field names on first access.
+
+    Replaces itself in the owning class with the plain attributes set by
+    ``_set_field_names()``, so later reads are ordinary class-attribute
+    lookups.
+    """
+
+    __slots__ = ("attr",)
+
+    def __init__(self, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, obj: Any, owner: type) -> Any:
+        _set_field_names(owner)
+        return getattr(owner, self.attr)
+
+
+_FIELD_CACHE_ATTRS = ("_field_names", "_field_set", "_field_values")
+
+
+def _set_field_names(cls: type) -> None:
+    names = tuple(f.name for f in fields(cls))
+    setattr(cls, "_field_names", names)
+    setattr(cls, "_field_set", frozenset(names))
+    # Fetches every field in one C call; the models always have several
+    # fields, so attrgetter returns a tuple rather than a single value.
+    setattr(cls, "_field_values", attrgetter(*names))
+
+
+def _cache_field_names(cls: _C) -> _C:
+    """
+    Cache a dataclass's fields on the class for the dict-style methods.
+
+    Sets ``_field_names`` (tuple), ``_field_set`` (frozenset) and
+    ``_field_values`` (an ``operator.attrgetter`` returning the tuple of
+    field values in one C call), so methods do not walk
+    ``__dataclass_fields__``. Subclasses get lazy attributes, resolved after
+    their own ``@dataclass`` has run, so fields they add are included. Apply
+    outermost, after ``_slotted``, which rebuilds the class.
+    """
+    _set_field_names(cls)
+
+    def __init_subclass__(subclass: type, **kwargs: Any) -> None:
+        super(cls, subclass).__init_subclass__(**kwargs)  # type: ignore[arg-type,misc]
+        for attr in _FIELD_CACHE_ATTRS:
+            setattr(subclass, attr, _LazyFieldNames(attr))
+
+    setattr(cls, "__init_subclass__", classmethod(__init_subclass__))
+    return cls
+
+
+def _read_only(mapping: Mapping[str, Any]) -> Mapping[str, Any]:
+    # Mapping proxies are taken to come from another model and are shared;
+    # anything else is copied so later changes by the caller do not show.
+    if type(mapping) is MappingProxyType:
+        return mapping
+    return MappingProxyType(dict(mapping))
+
+
+class _FieldView(Mapping[str, Any]):
+    """
+    Read-only mapping over a model's fields, returned by ``to_mapping()``.
+
+    Values are read from the model on access and are not copied.
+    """
+
+    __slots__ = ("_model",)
+
+    def __init__(self, model: Any) -> None:
+        self._model = model
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._model._field_set:
+            return getattr(self._model, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._model._field_set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._model._field_names)
+
+    def __len__(self) -> int:
+        return len(self._model._field_names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+# Immutable leaf types that to_dict() returns as-is rather than copying.
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), bytes, complex})
+
+
+def _to_dict_value(value: Any) -> Any:
+    """
+    Copy a field value for ``to_dict()``, like ``dataclasses.asdict``.
+
+    Mappings and dataclass instances become dicts and lists and tuples are
+    copied element by element, recursively; other objects are deep-copied. Atomic values are returned
+    unchanged, which skips the ``deepcopy`` call ``asdict`` makes per leaf.
+    """
+    cls = type(value)
+    if cls in _ATOMIC_TYPES:
+        return value
+    if cls is dict or cls is MappingProxyType:
+        return {k: v if type(v) in _ATOMIC_TYPES else _to_dict_value(v) for k, v in value.items()}
+    if cls is list:
+        return [v if type(v) in _ATOMIC_TYPES else _to_dict_value(v) for v in value]
+    if cls is tuple or cls is _FrozenList:
+        return tuple([v if type(v) in _ATOMIC_TYPES else _to_dict_value(v) for v in value])
+    if isinstance(value, Mapping):
+        return {k: v if type(v) in _ATOMIC_TYPES else _to_dict_value(v) for k, v in value.items()}
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _to_dict_value(getattr(value, f.name)) for f in fields(value)}
+    return copy.deepcopy(value)
+
+
+def _json_default(value: Any) -> Any:
+    # Covers the types msgspec encodes natively, so to_json() accepts the same
+    # values whichever backend is installed.
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (tuple, set, frozenset)):  # orjson only encodes exact tuples
+        return list(value)
+    if isinstance(value, (date, time)):  # includes datetime
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_MSGSPEC_ENCODER = msgspec.json.Encoder(enc_hook=_json_default) if msgspec is not None else None
+
+
+def _to_json(model: Any) -> bytes:
+    """Serialize a model to compact UTF-8 JSON, via msgspec or orjson when installed."""
+    if msgspec is not None:
+        # msgspec also encodes dataclasses natively, and is the faster of the two.
+        return _MSGSPEC_ENCODER.encode(model)  # type: ignore[union-attr]
+    if orjson is not None:
+        # orjson encodes dataclasses natively, without an intermediate dict.
+        return orjson.dumps(model, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        model.to_dict(), default=_json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _from_json(data: Union[bytes, str]) -> Any:
+    # Decode to plain containers; msgspec's typed decoding would bypass __init__.
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+class _UnifiedAnalysisDictRequired(TypedDict):
+    document_type: str
+    confidence: float
+    framework: str
+
+
+class UnifiedAnalysisDict(_UnifiedAnalysisDictRequired, total=False):
+    """
+    Plain-dict form of UnifiedAnalysisResult.
+
+    For bulk pipelines that produce many results, building these dicts is
+    cheaper than constructing dataclass instances. Convert at API boundaries
+    with ``UnifiedAnalysisResult.from_dict()``.
+
+    Example:
+        >>> data: UnifiedAnalysisDict = {
+        ...     "document_type": "Test", "confidence": 1.0, "framework": "test"
+        ... }
+        >>> UnifiedAnalysisResult.from_dict(data).document_type
+        'Test'
+    """
+
+    metadata: Dict[str, Any]
+    content: Optional[str]
+    ai_opportunities: List[str]
+    raw_analysis: Dict[str, Any]
+
+
+class _ChunkInfoDictRequired(TypedDict):
+    chunk_id: str
+    content: str
+
+
+class ChunkInfoDict(_ChunkInfoDictRequired, total=False):
+    """
+    Plain-dict form of ChunkInfo.
+
+    Convert at API boundaries with ``ChunkInfo.from_dict()``.
+
+    Example:
+        >>> data: ChunkInfoDict = {"chunk_id": "c1", "content": "text"}
+        >>> ChunkInfo.from_dict(data).chunk_id
+        'c1'
+    """
+
+    metadata: Dict[str, Any]
+    token_count: int
+    chunk_type: str
+
+
+@_cache_field_names
+@_fast_init(
+    interned=("document_type", "framework"),
+    nullable=("metadata", "ai_opportunities", "raw_analysis"),
+    metadata=_read_only,
+    ai_opportunities=_frozen_list,
+    raw_analysis=_read_only,
+)
+@_slotted(weakref_slot=True)
+@dataclass(frozen=True, eq=False)
+class UnifiedAnalysisResult(Mapping[str, Any]):
     """
     Standard result structure returned by all framework analyzers.
 
     This provides a consistent interface regardless of which framework
     performed the analysis.
 
+    Results are immutable: fields cannot be reassigned, ``metadata`` and
+    ``raw_analysis`` are stored as read-only copies of the mappings passed
+    in, and ``ai_opportunities`` as a tuple that also compares equal to a
+    list with the same items. The copies are shallow: containers nested
+    inside ``metadata`` or ``raw_analysis`` are shared with the caller, who
+    must not modify them afterwards. Defaults are shared empty singletons,
+    so constructing a result without these fields allocates no containers;
+    passing ``None`` for them selects the same defaults. Use ``with_()`` to
+    derive a modified copy. Equality and hashing are by identity, so results
+    can be shared between threads and used as dict keys or set members.
+
     Supports multiple access patterns:
     - Dict-style: result['document_type']
     - Attribute-style: result.document_type
+    - Mapping: dict(result), **result, len(result), iteration over field names
     - Dict conversion: result.to_dict()
 
+    A result is a read-only ``Mapping`` of field names to values, so
+    ``dict(result)`` builds a shallow dict straight from the fields. Use
+    ``to_dict()`` when the nested containers must be mutable copies.
+
     Attributes:
         document_type: Human-readable document type (e.g., 'PDF Technical Manual', 'S1000D XML')
         confidence: Confidence score 0.0-1.0 for document type detection
@@ -49,15 +551,166 @@ class UnifiedAnalysisResult:
     document_type: str
     confidence: float
     framework: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_Shared(_EMPTY_MAPPING))
     content: Optional[str] = None
-    ai_opportunities: List[str] = field(default_factory=list)
-    raw_analysis: Dict[str, Any] = field(default_factory=dict)
+    ai_opportunities: Sequence[str] = _EMPTY_SEQUENCE
+    raw_analysis: Mapping[str, Any] = field(default_factory=_Shared(_EMPTY_MAPPING))
+
+    if TYPE_CHECKING:
+        _field_names: ClassVar[Tuple[str, ...]]
+        _field_set: ClassVar[FrozenSet[str]]
+        _field_values: ClassVar[attrgetter[Tuple[Any, ...]]]
+
+    # Mapping compares by content and disables hashing; keep identity semantics.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Mapping proxies cannot be pickled and frozen slots reject the default
+        # state restore, so rebuild through __init__ from plain containers.
+        return (type(self), tuple(self.to_dict().values()))
+
+    @classmethod
+    def from_dict(cls: Type[_R], data: Mapping[str, Any]) -> _R:
+        """
+        Create a result from a dict such as a UnifiedAnalysisDict.
+
+        Args:
+            data: Mapping of field names to values
+
+        Returns:
+            New UnifiedAnalysisResult
+
+        Raises:
+            TypeError: If data has unknown keys or lacks a required field
+
+        Example:
+            >>> result = UnifiedAnalysisResult.from_dict(
+            ...     {"document_type": "Test", "confidence": 1.0, "framework": "test"}
+            ... )
+            >>> result.framework
+            'test'
+        """
+        return cls(**data)
+
+    @classmethod
+    def get_or_create(cls: Type[_R], **kwargs: Any) -> _R:
+        """
+        Return a shared result with the given field values, creating it if needed.
+
+        Results are immutable, so callers that repeatedly build the same
+        result (for example a fixed "unknown document" answer) can share one
+        instance. Instances are held weakly and dropped once unused. Calls
+        whose values are unhashable, such as a ``metadata`` dict, are not
+        cached and always construct a new result.
+
+        Args:
+            **kwargs: Field values, as for the constructor
+
+        Returns:
+            UnifiedAnalysisResult with these field values
+
+        Example:
+            >>> first = UnifiedAnalysisResult.get_or_create(
+            ...     document_type="Unknown", confidence=0.0, framework="test"
+            ... )
+            >>> first is UnifiedAnalysisResult.get_or_create(
+            ...     document_type="Unknown", confidence=0.0, framework="test"
+            ... )
+            True
+        """
+        try:
+            # Value types are part of the key so that 1, 1.0 and True differ.
+            key = (cls, frozenset([(name, type(value), value) for name, value in kwargs.items()]))
+            result = _INSTANCE_CACHE.get(key)
+        except TypeError:  # unhashable field value
+            return cls(**kwargs)
+        if result is None:
+            result = _INSTANCE_CACHE[key] = cls(**kwargs)
+        return cast(_R, result)
+
+    def to_json(self) -> bytes:
+        """
+        Serialize to compact UTF-8 JSON.
+
+        Uses ``msgspec`` (``pip install analysis-framework-base[msgspec]``)
+        or ``orjson`` (``pip install analysis-framework-base[json]``) when
+        installed, preferring ``msgspec``; both encode the result directly
+        without building an intermediate dict. Otherwise falls back to the
+        standard library ``json`` module.
+
+        Returns:
+            JSON document as bytes
+
+        Example:
+            >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+            >>> result.to_json()
+            b'{"document_type":"Test","confidence":1.0,"framework":"test",...}'
+        """
+        return _to_json(self)
+
+    @classmethod
+    def from_json(cls: Type[_R], data: Union[bytes, str]) -> _R:
+        """
+        Create a result from JSON produced by ``to_json()``.
+
+        Args:
+            data: JSON document as bytes or str
+
+        Returns:
+            New UnifiedAnalysisResult
+
+        Example:
+            >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+            >>> UnifiedAnalysisResult.from_json(result.to_json()).document_type
+            'Test'
+        """
+        return cls.from_dict(_from_json(data))
+
+    def add_ai_opportunity(self: _R, opportunity: str) -> _R:
+        """
+        Return a copy of this result with an AI opportunity appended.
+
+        Args:
+            opportunity: Suggested AI/ML use case
+
+        Returns:
+            New UnifiedAnalysisResult
+
+        Example:
+            >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+            >>> result.add_ai_opportunity("QA").ai_opportunities
+            ('QA',)
+        """
+        return self.with_(ai_opportunities=_FrozenList([*self.ai_opportunities, opportunity]))
+
+    def with_(self: _R, **changes: Any) -> _R:
+        """
+        Return a copy of this result with the given fields replaced.
+
+        Args:
+            **changes: Field names and their new values
+
+        Returns:
+            New UnifiedAnalysisResult; this result is left unchanged
+
+        Example:
+            >>> result = UnifiedAnalysisResult(document_type="Test", confidence=0.5, framework="test")
+            >>> result.with_(confidence=0.9).confidence
+            0.9
+        """
+        return replace(self, **changes)
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary for serialization.
 
+        Container values are copied recursively, as ``dataclasses.asdict``
+        would, so the returned dict can be modified freely without affecting
+        this result; immutable leaf values (strings, numbers, ``None``) are
+        shared rather than copied. Mappings come back as dicts and
+        ``ai_opportunities`` as a list.
+
         Returns:
             Dictionary representation of the result
 
@@ -68,18 +721,40 @@ class UnifiedAnalysisResult:
             >>> result.to_dict()
             {'document_type': 'Test', 'confidence': 1.0, 'framework': 'test', ...}
         """
-        return asdict(self)
+        data = {name: _to_dict_value(getattr(self, name)) for name in self._field_names}
+        if type(data["ai_opportunities"]) is not list:
+            data["ai_opportunities"] = list(data["ai_opportunities"])
+        return data
+
+    def to_mapping(self) -> Mapping[str, Any]:
+        """
+        Return a read-only mapping of field names to values, without copying.
+
+        Results are already immutable mappings, so this returns the result
+        itself. It exists so that code handling both models can call
+        ``to_mapping()`` instead of paying for ``to_dict()`` when it only
+        reads the fields.
+
+        Returns:
+            This result
+
+        Example:
+            >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+            >>> result.to_mapping()["framework"]
+            'test'
+        """
+        return self
 
     def get(self, key: str, default: Any = None) -> Any:
         """
         Dict-style get method.
 
         Args:
-            key: Attribute name
-            default: Default value if key not found
+            key: Field name
+            default: Default value if key is not a field
 
         Returns:
-            Attribute value or default
+            Field value or default
 
         Example:
             >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
@@ -88,40 +763,39 @@ class UnifiedAnalysisResult:
             >>> result.get('missing_key', 'default')
             'default'
         """
-        return getattr(self, key, default)
+        return getattr(self, key) if key in self._field_set else default
 
     def __getitem__(self, key: str) -> Any:
         """
         Support dict-style access: result['key'].
 
         Args:
-            key: Attribute name
+            key: Field name
 
         Returns:
-            Attribute value
+            Field value
 
         Raises:
-            KeyError: If key not found
+            KeyError: If key is not a field
 
         Example:
             >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
             >>> result['document_type']
             'Test'
         """
-        try:
+        if key in self._field_set:
             return getattr(self, key)
-        except AttributeError:
-            raise KeyError(f"'{key}' not found in UnifiedAnalysisResult")
+        raise KeyError(key)
 
-    def __contains__(self, key: str) -> bool:
+    def __contains__(self, key: object) -> bool:
         """
         Support 'in' operator.
 
         Args:
-            key: Attribute name
+            key: Field name
 
         Returns:
-            True if attribute exists
+            True if key is a field name
 
         Example:
             >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
@@ -130,28 +804,36 @@ class UnifiedAnalysisResult:
             >>> 'missing_key' in result
             False
         """
-        return hasattr(self, key)
+        return key in self._field_set
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over field names, in declaration order."""
+        return iter(self._field_names)
+
+    def __len__(self) -> int:
+        """Return the number of fields."""
+        return len(self._field_names)
 
-    def keys(self):
+    def keys(self) -> Tuple[str, ...]:  # type: ignore[override]
         """
         Return field names like a dict.
 
         Returns:
-            Iterator of field names
+            Tuple of field names, in declaration order
 
         Example:
             >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
             >>> list(result.keys())
             ['document_type', 'confidence', 'framework', 'metadata', 'content', ...]
         """
-        return self.__dataclass_fields__.keys()
+        return self._field_names
 
-    def values(self):
+    def values(self) -> Tuple[Any, ...]:  # type: ignore[override]
         """
         Return field values like a dict.
 
         Returns:
-            List of field values
+            Tuple of field values
 
         Example:
             >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
@@ -159,14 +841,14 @@ class UnifiedAnalysisResult:
             >>> 'Test' in values
             True
         """
-        return [getattr(self, k) for k in self.keys()]
+        return self._field_values(self)
 
-    def items(self):
+    def items(self) -> Tuple[Tuple[str, Any], ...]:  # type: ignore[override]
         """
         Return (key, value) pairs like a dict.
 
         Returns:
-            List of (field_name, value) tuples
+            Tuple of (field_name, value) tuples
 
         Example:
             >>> result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
@@ -174,10 +856,13 @@ class UnifiedAnalysisResult:
             >>> ('document_type', 'Test') in items
             True
         """
-        return [(k, getattr(self, k)) for k in self.keys()]
+        return tuple([(k, getattr(self, k)) for k in self._field_names])
 
 
-@dataclass
+@_cache_field_names
+@_fast_init(interned=("chunk_type",), nullable=("metadata",), metadata=_read_only)
+@_slotted
+@dataclass(frozen=True)
 class ChunkInfo:
     """
     Standard structure for document chunks.
@@ -185,6 +870,17 @@ class ChunkInfo:
     Represents a single chunk from a document, suitable for embedding
     and vector database storage.
 
+    Chunks are immutable: fields cannot be reassigned and ``metadata`` is
+    stored as a read-only shallow copy of the mapping passed in, so a chunk
+    can be read from many threads without locking. Chunks created without
+    metadata, or with ``metadata=None``, share one empty mapping. Use
+    ``with_()`` or ``set_metadata()`` to derive a modified copy. Chunks
+    compare equal by value and are unhashable.
+
+    ``chunk_type`` is interned on construction, so chunks share one copy of
+    each type name and comparisons against literals such as ``"code"``
+    usually succeed on identity.
+
     Attributes:
         chunk_id: Unique identifier for this chunk
         content: Text content of the chunk
@@ -208,14 +904,69 @@ class ChunkInfo:
 
     chunk_id: str
     content: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_Shared(_EMPTY_MAPPING))
     token_count: int = 0
     chunk_type: str = "text"
 
+    if TYPE_CHECKING:
+        _field_names: ClassVar[Tuple[str, ...]]
+        _field_set: ClassVar[FrozenSet[str]]
+        _field_values: ClassVar[attrgetter[Tuple[Any, ...]]]
+
+    # __eq__ is deliberately left to @dataclass: its generated tuple compare
+    # reads the slots with specialized bytecode, and measured about twice as
+    # fast as comparing _field_values() tuples on CPython 3.11 and 3.13.
+    # Mapping proxies are unhashable, so the generated field hash could only
+    # fail; keep chunks explicitly unhashable instead.
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The shared default metadata is a mapping proxy, which cannot be
+        # pickled; rebuild through __init__ from plain containers.
+        return (type(self), tuple(self.to_dict().values()))
+
+    def set_metadata(self: _K, key: str, value: Any) -> _K:
+        """
+        Return a copy of this chunk with a metadata entry set.
+
+        Args:
+            key: Metadata key
+            value: Metadata value
+
+        Returns:
+            New ChunkInfo; this chunk is left unchanged
+
+        Example:
+            >>> chunk = ChunkInfo(chunk_id="test", content="test content")
+            >>> chunk.set_metadata("page", 1).metadata
+            mappingproxy({'page': 1})
+        """
+        return self.with_(metadata={**self.metadata, key: value})
+
+    def with_(self: _K, **changes: Any) -> _K:
+        """
+        Return a copy of this chunk with the given fields replaced.
+
+        Args:
+            **changes: Field names and their new values
+
+        Returns:
+            New ChunkInfo; this chunk is left unchanged
+
+        Example:
+            >>> chunk = ChunkInfo(chunk_id="c1", content="text")
+            >>> chunk.with_(token_count=12).token_count
+            12
+        """
+        return replace(self, **changes)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary for serialization.
 
+        ``metadata`` is copied recursively into a plain dict, so the returned
+        dict can be modified without affecting this chunk.
+
         Returns:
             Dictionary representation of the chunk
 
@@ -224,27 +975,160 @@ class ChunkInfo:
             >>> chunk.to_dict()
             {'chunk_id': 'test', 'content': 'test content', ...}
         """
-        return asdict(self)
+        return {name: _to_dict_value(getattr(self, name)) for name in self._field_names}
+
+    def to_mapping(self) -> Mapping[str, Any]:
+        """
+        Return a read-only view of the chunk's fields, without copying.
+
+        Unlike ``to_dict()``, nothing is copied: values, including
+        ``metadata``, are read from the chunk on access. Use it for
+        serializers and other read-only consumers; use ``to_dict()`` when the
+        result will be modified.
+
+        Returns:
+            Mapping of field names to the chunk's values
+
+        Example:
+            >>> chunk = ChunkInfo(chunk_id="c1", content="text", metadata={"page": 1})
+            >>> chunk.to_mapping()["metadata"]["page"]
+            1
+        """
+        return _FieldView(self)
+
+    def to_json(self) -> bytes:
+        """
+        Serialize to compact UTF-8 JSON, via ``msgspec`` or ``orjson`` when installed.
+
+        Returns:
+            JSON document as bytes
+
+        Example:
+            >>> ChunkInfo(chunk_id="c1", content="text").to_json()
+            b'{"chunk_id":"c1","content":"text","metadata":{},...}'
+        """
+        return _to_json(self)
+
+    @classmethod
+    def from_json(cls: Type[_K], data: Union[bytes, str]) -> _K:
+        """
+        Create a chunk from JSON produced by ``to_json()``.
+
+        Args:
+            data: JSON document as bytes or str
+
+        Returns:
+            New ChunkInfo
+        """
+        return cls.from_dict(_from_json(data))
+
+    @classmethod
+    def from_dict(cls: Type[_K], data: Mapping[str, Any]) -> _K:
+        """
+        Create a chunk from a dict such as a ChunkInfoDict.
+
+        Args:
+            data: Mapping of field names to values
+
+        Returns:
+            New ChunkInfo
+
+        Raises:
+            TypeError: If data has unknown keys or lacks a required field
+
+        Example:
+            >>> chunk = ChunkInfo.from_dict({"chunk_id": "c1", "content": "text"})
+            >>> chunk.chunk_id
+            'c1'
+        """
+        return cls(**data)
 
     def __getitem__(self, key: str) -> Any:
         """
         Support dict-style access.
 
         Args:
-            key: Attribute name
+            key: Field name
 
         Returns:
-            Attribute value
+            Field value
 
         Raises:
-            KeyError: If key not found
+            KeyError: If key is not a field
 
         Example:
             >>> chunk = ChunkInfo(chunk_id="test", content="test content")
             >>> chunk['chunk_id']
             'test'
         """
-        try:
+        if key in self._field_set:
             return getattr(self, key)
-        except AttributeError:
-            raise KeyError(f"'{key}' not found in ChunkInfo")
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Dict-style get method.
+
+        Args:
+            key: Field name
+            default: Default value if key is not a field
+
+        Returns:
+            Field value or default
+
+        Example:
+            >>> chunk = ChunkInfo(chunk_id="test", content="test content")
+            >>> chunk.get('chunk_type')
+            'text'
+            >>> chunk.get('missing_key', 'default')
+            'default'
+        """
+        return getattr(self, key) if key in self._field_set else default
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Support 'in' operator.
+
+        Args:
+            key: Field name
+
+        Returns:
+            True if key is a field name
+
+        Example:
+            >>> chunk = ChunkInfo(chunk_id="test", content="test content")
+            >>> 'chunk_id' in chunk
+            True
+        """
+        return key in self._field_set
+
+    def keys(self) -> Tuple[str, ...]:
+        """
+        Return field names like a dict.
+
+        Returns:
+            Tuple of field names, in declaration order
+
+        Example:
+            >>> ChunkInfo(chunk_id="test", content="test content").keys()
+            ('chunk_id', 'content', 'metadata', 'token_count', 'chunk_type')
+        """
+        return self._field_names
+
+    def values(self) -> Tuple[Any, ...]:
+        """
+        Return field values like a dict.
+
+        Returns:
+            Tuple of field values, in declaration order
+        """
+        return self._field_values(self)
+
+    def items(self) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Return (key, value) pairs like a dict.
+
+        Returns:
+            Tuple of (field_name, value) tuples
+        """
+        return tuple([(k, getattr(self, k)) for k in self._field_names])
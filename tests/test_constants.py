@@ -2,7 +2,7 @@
 Tests for constants (ChunkStrategy enum).
 """
 
-from analysis_framework_base import ChunkStrategy
+from analysis_framework_base import ChunkStrategy, ChunkStrategyId
 
 
 class TestChunkStrategy:
@@ -72,3 +72,25 @@ class TestChunkStrategy:
         """Convert enum to string."""
         assert str(ChunkStrategy.AUTO.value) == "auto"
         assert str(ChunkStrategy.HIERARCHICAL.value) == "hierarchical"
+
+    def test_coerce_known_strategy(self):
+        """coerce() maps standard names to enum members."""
+        assert ChunkStrategy.coerce("auto") is ChunkStrategy.AUTO
+        assert ChunkStrategy.coerce("page_aware") is ChunkStrategy.PAGE_AWARE
+        assert ChunkStrategy.coerce(ChunkStrategy.HIERARCHICAL) is ChunkStrategy.HIERARCHICAL
+
+    def test_coerce_unknown_strategy(self):
+        """coerce() passes framework-specific names through unchanged."""
+        assert ChunkStrategy.coerce("paragraph") == "paragraph"
+        assert not isinstance(ChunkStrategy.coerce("paragraph"), ChunkStrategy)
+
+    def test_ids_index_strategies(self):
+        """Ids are dense, follow declaration order and map back to the member."""
+        assert [strategy.id for strategy in ChunkStrategy] == list(range(len(ChunkStrategy)))
+        for strategy in ChunkStrategy:
+            assert isinstance(strategy.id, ChunkStrategyId)
+            assert strategy.id.name == strategy.name
+            assert strategy.id.strategy is strategy
+
+        handlers = [strategy.value.upper() for strategy in ChunkStrategy]
+        assert handlers[ChunkStrategy.TABLE_AWARE.id] == "TABLE_AWARE"
@@ -3,7 +3,15 @@ Tests for abstract base classes (interfaces).
 """
 
 import pytest
-from analysis_framework_base import BaseAnalyzer, BaseChunker, UnifiedAnalysisResult, ChunkInfo
+from analysis_framework_base import (
+    AnalysisError,
+    BaseAnalyzer,
+    BaseChunker,
+    MemoizedAnalyzer,
+    UnifiedAnalysisResult,
+    ChunkInfo,
+    ChunkStrategy,
+)
 
 
 class TestBaseAnalyzer:
@@ -26,7 +34,7 @@ class TestBaseAnalyzer:
                 )
 
             def get_supported_formats(self):
-                return [".txt", ".md"]
+                return frozenset({".txt", ".md"})
 
         analyzer = ConcreteAnalyzer()
         assert isinstance(analyzer, BaseAnalyzer)
@@ -40,7 +48,8 @@ class TestBaseAnalyzer:
 
         # Test get_supported_formats
         formats = analyzer.get_supported_formats()
-        assert formats == [".txt", ".md"]
+        assert formats == frozenset({".txt", ".md"})
+        assert ".md" in formats
 
     def test_incomplete_implementation_fails(self):
         """Incomplete implementation cannot be instantiated."""
@@ -54,6 +63,176 @@ class TestBaseAnalyzer:
         with pytest.raises(TypeError):
             IncompleteAnalyzer()
 
+    def test_analyze_batch(self):
+        """analyze_batch() returns one result per path, in input order."""
+
+        class EchoAnalyzer(BaseAnalyzer):
+            def analyze_unified(self, file_path: str, **kwargs) -> UnifiedAnalysisResult:
+                if file_path == "bad.txt":
+                    raise AnalysisError("cannot analyze")
+                return UnifiedAnalysisResult(
+                    document_type=file_path, confidence=kwargs["confidence"], framework="echo"
+                )
+
+            def get_supported_formats(self):
+                return frozenset({".txt"})
+
+        analyzer = EchoAnalyzer()
+        paths = [f"doc{i}.txt" for i in range(20)]
+
+        for max_workers in (None, 1, 4):
+            results = analyzer.analyze_batch(paths, max_workers=max_workers, confidence=0.5)
+            assert [r.document_type for r in results] == paths
+            assert all(r.confidence == 0.5 for r in results)
+
+        assert analyzer.analyze_batch([]) == []
+        with pytest.raises(AnalysisError):
+            analyzer.analyze_batch(["a.txt", "bad.txt"], confidence=0.5)
+
+    def test_duck_typed_analyzer_is_not_recognized(self):
+        """Only subclasses, which inherit analyze_batch(), pass isinstance."""
+
+        class DuckAnalyzer:
+            def analyze_unified(self, file_path: str, **kwargs):
+                return UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="t")
+
+            def get_supported_formats(self):
+                return frozenset({".txt"})
+
+        class NotAnAnalyzer:
+            def analyze_unified(self, file_path: str, **kwargs):
+                return None
+
+        assert not isinstance(DuckAnalyzer(), BaseAnalyzer)
+        assert not issubclass(DuckAnalyzer, BaseAnalyzer)
+        assert not isinstance(NotAnAnalyzer(), BaseAnalyzer)
+
+
+class CountingAnalyzer(MemoizedAnalyzer):
+    """MemoizedAnalyzer that records how often the real analysis runs."""
+
+    def __init__(self, maxsize: int = 128):
+        super().__init__(maxsize=maxsize)
+        self.calls = 0
+
+    def _compute(self, file_path: str, **kwargs) -> UnifiedAnalysisResult:
+        self.calls += 1
+        return UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+
+    def get_supported_formats(self):
+        return frozenset({".txt"})
+
+
+class TestMemoizedAnalyzer:
+    """Test MemoizedAnalyzer result caching."""
+
+    def test_repeated_call_uses_cache(self, tmp_path):
+        """Unchanged files are analyzed once."""
+        path = tmp_path / "doc.txt"
+        path.write_text("content")
+        analyzer = CountingAnalyzer()
+
+        first = analyzer.analyze_unified(str(path))
+        second = analyzer.analyze_unified(str(path))
+
+        assert first is second
+        assert analyzer.calls == 1
+
+    def test_cached_result_cannot_be_modified(self, tmp_path):
+        """Callers cannot change a cached result seen by later callers."""
+        path = tmp_path / "doc.txt"
+        path.write_text("content")
+
+        class ListAnalyzer(CountingAnalyzer):
+            def _compute(self, file_path: str, **kwargs) -> UnifiedAnalysisResult:
+                return UnifiedAnalysisResult(
+                    document_type="Test",
+                    confidence=1.0,
+                    framework="test",
+                    ai_opportunities=["QA"],
+                )
+
+        analyzer = ListAnalyzer()
+        with pytest.raises(AttributeError):
+            analyzer.analyze_unified(str(path)).ai_opportunities.append("POISON")
+        assert analyzer.analyze_unified(str(path)).ai_opportunities == ["QA"]
+
+    def test_modified_file_is_reanalyzed(self, tmp_path):
+        """Changing the file invalidates its cached result."""
+        path = tmp_path / "doc.txt"
+        path.write_text("content")
+        analyzer = CountingAnalyzer()
+
+        analyzer.analyze_unified(str(path))
+        path.write_text("longer content")
+        analyzer.analyze_unified(str(path))
+
+        assert analyzer.calls == 2
+
+    def test_kwargs_are_part_of_key(self, tmp_path):
+        """Different options produce separate cache entries."""
+        path = tmp_path / "doc.txt"
+        path.write_text("content")
+        analyzer = CountingAnalyzer()
+
+        analyzer.analyze_unified(str(path), mode="fast")
+        analyzer.analyze_unified(str(path), mode="full")
+        analyzer.analyze_unified(str(path), mode="fast")
+
+        assert analyzer.calls == 2
+
+    def test_unhashable_kwargs_bypass_cache(self, tmp_path):
+        """Calls with unhashable options are always computed."""
+        path = tmp_path / "doc.txt"
+        path.write_text("content")
+        analyzer = CountingAnalyzer()
+
+        analyzer.analyze_unified(str(path), options={"a": 1})
+        analyzer.analyze_unified(str(path), options={"a": 1})
+
+        assert analyzer.calls == 2
+
+    def test_missing_file_bypasses_cache(self, tmp_path):
+        """Files that cannot be stat'ed are passed straight to _compute()."""
+        analyzer = CountingAnalyzer()
+
+        analyzer.analyze_unified(str(tmp_path / "missing.txt"))
+        analyzer.analyze_unified(str(tmp_path / "missing.txt"))
+
+        assert analyzer.calls == 2
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path):
+        """The cache holds at most maxsize results."""
+        paths = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            path = tmp_path / name
+            path.write_text(name)
+            paths.append(str(path))
+        analyzer = CountingAnalyzer(maxsize=2)
+
+        analyzer.analyze_unified(paths[0])
+        analyzer.analyze_unified(paths[1])
+        analyzer.analyze_unified(paths[0])
+        analyzer.analyze_unified(paths[2])
+        assert analyzer.calls == 3
+
+        analyzer.analyze_unified(paths[0])
+        assert analyzer.calls == 3
+        analyzer.analyze_unified(paths[1])
+        assert analyzer.calls == 4
+
+    def test_clear_cache(self, tmp_path):
+        """clear_cache() forces the next call to recompute."""
+        path = tmp_path / "doc.txt"
+        path.write_text("content")
+        analyzer = CountingAnalyzer()
+
+        analyzer.analyze_unified(str(path))
+        analyzer.clear_cache()
+        analyzer.analyze_unified(str(path))
+
+        assert analyzer.calls == 2
+
 
 class TestBaseChunker:
     """Test BaseChunker abstract interface."""
@@ -83,7 +262,7 @@ class TestBaseChunker:
                 ]
 
             def get_supported_strategies(self):
-                return ["auto", "hierarchical"]
+                return frozenset({"auto", "hierarchical"})
 
         chunker = ConcreteChunker()
         assert isinstance(chunker, BaseChunker)
@@ -97,7 +276,7 @@ class TestBaseChunker:
 
         # Test get_supported_strategies
         strategies = chunker.get_supported_strategies()
-        assert strategies == ["auto", "hierarchical"]
+        assert strategies == frozenset({"auto", "hierarchical"})
 
     def test_incomplete_chunker_implementation_fails(self):
         """Incomplete chunker implementation cannot be instantiated."""
@@ -116,3 +295,65 @@ class TestBaseChunker:
 
         with pytest.raises(TypeError):
             IncompleteChunker()
+
+    def test_duck_typed_chunker_is_not_recognized(self):
+        """Only subclasses, which inherit supports(), pass isinstance."""
+
+        class DuckChunker:
+            def chunk_document(self, file_path, analysis, strategy="auto", **kwargs):
+                return []
+
+            def get_supported_strategies(self):
+                return frozenset({"auto"})
+
+        assert not isinstance(DuckChunker(), BaseChunker)
+        assert not isinstance(object(), BaseChunker)
+
+    def test_supports(self):
+        """supports() checks strategies against get_supported_strategies()."""
+
+        class CountingChunker(BaseChunker):
+            calls = 0
+
+            def chunk_document(self, file_path, analysis, strategy="auto", **kwargs):
+                return []
+
+            def get_supported_strategies(self):
+                type(self).calls += 1
+                return frozenset({"auto", "hierarchical"})
+
+        chunker = CountingChunker()
+        assert chunker.supports("auto")
+        assert chunker.supports(ChunkStrategy.HIERARCHICAL)
+        assert not chunker.supports("page_aware")
+        assert CountingChunker().supports("auto")
+        assert CountingChunker.calls == 1
+
+    def test_supports_is_cached_per_class(self):
+        """Subclasses that change their strategies get their own cache."""
+
+        class ParentChunker(BaseChunker):
+            def chunk_document(self, file_path, analysis, strategy="auto", **kwargs):
+                return []
+
+            def get_supported_strategies(self):
+                return frozenset({"auto"})
+
+        class ChildChunker(ParentChunker):
+            def get_supported_strategies(self):
+                return frozenset({"auto", "sliding_window"})
+
+        assert not ParentChunker().supports("sliding_window")
+        assert ChildChunker().supports("sliding_window")
+
+    def test_supports_accepts_legacy_list(self):
+        """supports() still works for implementations that return a list."""
+
+        class LegacyChunker(BaseChunker):
+            def chunk_document(self, file_path, analysis, strategy="auto", **kwargs):
+                return []
+
+            def get_supported_strategies(self):
+                return ["auto", "hierarchical"]
+
+        assert LegacyChunker().supports("hierarchical")
@@ -2,8 +2,63 @@
 Tests for data models (UnifiedAnalysisResult and ChunkInfo).
 """
 
+import copy
+import gc
+import json
+import pickle
+import sys
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from dataclasses import FrozenInstanceError, dataclass, field
+from types import MappingProxyType
+from uuid import UUID
+
 import pytest
-from analysis_framework_base import UnifiedAnalysisResult, ChunkInfo
+from analysis_framework_base import models
+from analysis_framework_base import (
+    UnifiedAnalysisResult,
+    ChunkInfo,
+    UnifiedAnalysisDict,
+    ChunkInfoDict,
+)
+
+
+@pytest.fixture(params=["msgspec", "orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with msgspec and orjson (when installed) and with the stdlib fallback."""
+    if request.param != "stdlib":
+        pytest.importorskip(request.param)
+    if request.param != "msgspec":
+        monkeypatch.setattr(models, "msgspec", None)
+    if request.param == "stdlib":
+        monkeypatch.setattr(models, "orjson", None)
+    return request.param
+
+
+@pytest.fixture(scope="class")
+def basic_result():
+    """Minimal result shared by the tests of a class. Read-only; do not mutate."""
+    return UnifiedAnalysisResult.get_or_create(
+        document_type="Test", confidence=1.0, framework="test"
+    )
+
+
+@pytest.fixture(scope="class")
+def basic_chunk():
+    """Minimal chunk shared by the tests of a class. Read-only; do not mutate."""
+    return ChunkInfo(chunk_id="test_001", content="Test")
+
+
+@pytest.mark.parametrize("model", ["basic_result", "basic_chunk"])
+def test_missing_key_error_names_key(model, request):
+    """Both models raise KeyError(key) for unknown keys, like a dict."""
+    instance = request.getfixturevalue(model)
+
+    with pytest.raises(KeyError) as excinfo:
+        instance["nonexistent_key"]
+    assert excinfo.value.args == ("nonexistent_key",)
 
 
 class TestUnifiedAnalysisResult:
@@ -45,60 +100,53 @@ class TestUnifiedAnalysisResult:
         assert len(result.ai_opportunities) == 2
         assert result.raw_analysis["element_count"] == 1000
 
-    def test_attribute_access(self):
+    def test_attribute_access(self, basic_result):
         """Access fields via attributes."""
-        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+        assert basic_result.document_type == "Test"
+        assert basic_result.confidence == 1.0
+        assert basic_result.framework == "test"
 
-        assert result.document_type == "Test"
-        assert result.confidence == 1.0
-        assert result.framework == "test"
-
-    def test_dict_style_access(self):
+    def test_dict_style_access(self, basic_result):
         """Access fields like a dictionary."""
-        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
-
-        assert result["document_type"] == "Test"
-        assert result["confidence"] == 1.0
-        assert result["framework"] == "test"
+        assert basic_result["document_type"] == "Test"
+        assert basic_result["confidence"] == 1.0
+        assert basic_result["framework"] == "test"
 
-    def test_dict_style_access_invalid_key(self):
+    def test_dict_style_access_invalid_key(self, basic_result):
         """Dict-style access with invalid key raises KeyError."""
-        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
-
         with pytest.raises(KeyError):
-            _ = result["nonexistent_key"]
+            _ = basic_result["nonexistent_key"]
 
-    def test_get_method(self):
+    def test_get_method(self, basic_result):
         """Use get() method like a dict."""
-        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
-
-        assert result.get("document_type") == "Test"
-        assert result.get("nonexistent", "default") == "default"
-        assert result.get("missing") is None
+        assert basic_result.get("document_type") == "Test"
+        assert basic_result.get("nonexistent", "default") == "default"
+        assert basic_result.get("missing") is None
 
-    def test_contains_operator(self):
+    def test_contains_operator(self, basic_result):
         """Use 'in' operator to check field existence."""
-        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
-
-        assert "document_type" in result
-        assert "confidence" in result
-        assert "nonexistent" not in result
+        assert "document_type" in basic_result
+        assert "confidence" in basic_result
+        assert "nonexistent" not in basic_result
+
+    def test_methods_are_not_keys(self, basic_result):
+        """Dict-style access only exposes fields, not methods."""
+        assert "to_dict" not in basic_result
+        assert basic_result.get("to_dict") is None
+        with pytest.raises(KeyError):
+            _ = basic_result["to_dict"]
 
-    def test_keys_method(self):
+    def test_keys_method(self, basic_result):
         """Get field names via keys()."""
-        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
-
-        keys = list(result.keys())
+        keys = basic_result.keys()
         assert "document_type" in keys
         assert "confidence" in keys
         assert "framework" in keys
         assert "metadata" in keys
 
-    def test_values_method(self):
+    def test_values_method(self, basic_result):
         """Get field values via values()."""
-        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
-
-        values = result.values()
+        values = basic_result.values()
         assert "Test" in values
         assert 1.0 in values
         assert "test" in values
@@ -107,11 +155,26 @@ class TestUnifiedAnalysisResult:
         """Get (key, value) pairs via items()."""
         result = UnifiedAnalysisResult(document_type="Test", confidence=0.9, framework="test")
 
-        items = list(result.items())
+        items = result.items()
         assert ("document_type", "Test") in items
         assert ("confidence", 0.9) in items
         assert ("framework", "test") in items
 
+    def test_keys_values_items_align(self):
+        """keys(), values() and items() list the same fields in the same order."""
+        result = UnifiedAnalysisResult(document_type="Test", confidence=0.9, framework="test")
+
+        assert result.keys() == (
+            "document_type",
+            "confidence",
+            "framework",
+            "metadata",
+            "content",
+            "ai_opportunities",
+            "raw_analysis",
+        )
+        assert tuple(zip(result.keys(), result.values())) == result.items()
+
     def test_to_dict_method(self):
         """Convert to dict via to_dict()."""
         result = UnifiedAnalysisResult(
@@ -128,6 +191,415 @@ class TestUnifiedAnalysisResult:
         assert result_dict["framework"] == "test"
         assert result_dict["metadata"]["key"] == "value"
 
+    def test_to_mapping_returns_self(self, basic_result):
+        """Results are already read-only mappings, so to_mapping() does not copy."""
+        assert basic_result.to_mapping() is basic_result
+
+    def test_subclass_fields_are_included(self):
+        """Fields added by a subclass show up in keys(), to_dict() and item access."""
+
+        @dataclass(frozen=True, eq=False)
+        class PagedResult(UnifiedAnalysisResult):
+            page_count: int = 0
+
+        result = PagedResult(document_type="Test", confidence=1.0, framework="test", page_count=3)
+
+        assert result.keys()[-1] == "page_count"
+        assert result["page_count"] == 3
+        assert result.to_dict()["page_count"] == 3
+        assert result.values()[-1] == 3
+        base = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+        assert "page_count" not in base
+
+        # The subclass's own __init__ still normalizes the inherited fields.
+        metadata = {"page": 1}
+        result = PagedResult(
+            document_type="".join(["Te", "st"]),
+            confidence=1.0,
+            framework="test",
+            metadata=metadata,
+            ai_opportunities=["QA"],
+            raw_analysis=None,
+        )
+        metadata["page"] = 2
+        assert result.metadata == {"page": 1}
+        with pytest.raises(TypeError):
+            result.metadata["page"] = 3
+        assert result.raw_analysis is base.raw_analysis
+        assert result.document_type is sys.intern("Test")
+        with pytest.raises(AttributeError):
+            result.ai_opportunities.append("POISON")
+
+    def test_uses_slots(self):
+        """Instances have no per-instance __dict__."""
+        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown_field = "value"
+
+    def test_is_immutable(self):
+        """Fields cannot be reassigned and mappings are read-only."""
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=1.0,
+            framework="test",
+            metadata={"key": "value"},
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            result.confidence = 0.5
+        with pytest.raises(TypeError):
+            result.metadata["key"] = "changed"
+        with pytest.raises(TypeError):
+            result.raw_analysis["key"] = "value"
+
+    def test_string_fields_are_interned(self):
+        """document_type and framework are interned strings."""
+        result = UnifiedAnalysisResult(
+            document_type="".join(["S1000D ", "Manual"]),
+            confidence=1.0,
+            framework="".join(["xml-analysis-", "framework"]),
+        )
+
+        assert result.document_type is sys.intern("S1000D Manual")
+        assert result.framework is sys.intern("xml-analysis-framework")
+
+    def test_defaults_are_shared(self):
+        """Results built without containers share the same empty defaults."""
+        first = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+        second = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+
+        assert first.metadata is second.metadata
+        assert first.raw_analysis is second.raw_analysis
+        assert first.ai_opportunities is second.ai_opportunities
+
+    def test_none_selects_shared_defaults(self):
+        """Passing None for a container field is the same as omitting it."""
+        default = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=1.0,
+            framework="test",
+            metadata=None,
+            ai_opportunities=None,
+            raw_analysis=None,
+        )
+
+        assert result.metadata is default.metadata
+        assert result.ai_opportunities is default.ai_opportunities
+        assert result.raw_analysis is default.raw_analysis
+        assert result.to_dict() == default.to_dict()
+
+    def test_json_roundtrip(self, json_backend):
+        """to_json() and from_json() round-trip a result."""
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=0.9,
+            framework="test",
+            metadata={"version": "4.2", "pages": {1: "intro"}},
+            content="Résumé",
+            ai_opportunities=["QA"],
+        )
+
+        data = result.to_json()
+        assert isinstance(data, bytes)
+        assert json.loads(data) == {
+            **result.to_dict(),
+            "metadata": {"version": "4.2", "pages": {"1": "intro"}},
+        }
+        restored = UnifiedAnalysisResult.from_json(data)
+        assert restored.content == "Résumé"
+        assert restored.ai_opportunities == ["QA"]
+
+    def test_json_encodes_common_types(self, json_backend):
+        """Every backend encodes dates, UUIDs, sets and dataclasses the same way."""
+        uid = UUID("12345678-1234-5678-1234-567812345678")
+        chunk = ChunkInfo(chunk_id="c1", content="text", metadata={"page": 1})
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=1.0,
+            framework="test",
+            metadata={
+                "created": datetime(2025, 10, 27, 9, 30, 15, 250),
+                "day": date(2025, 10, 27),
+                "at": time(9, 30),
+                "id": uid,
+                "tags": {"a"},
+                "frozen": frozenset({"b"}),
+                "pair": (1, 2),
+            },
+            raw_analysis={"chunks": [chunk]},
+        )
+
+        data = json.loads(result.to_json())
+        assert data["metadata"] == {
+            "created": "2025-10-27T09:30:15.000250",
+            "day": "2025-10-27",
+            "at": "09:30:00",
+            "id": "12345678-1234-5678-1234-567812345678",
+            "tags": ["a"],
+            "frozen": ["b"],
+            "pair": [1, 2],
+        }
+        assert data["raw_analysis"] == {"chunks": [json.loads(chunk.to_json())]}
+        assert json.loads(chunk.with_(metadata={"id": uid}).to_json())["metadata"] == {
+            "id": str(uid)
+        }
+
+    def test_default_ai_opportunities(self, basic_result, json_backend):
+        """The shared empty default behaves like both () and []."""
+        empty = basic_result.ai_opportunities
+
+        assert empty == [] and [] == empty and empty == ()
+        assert not empty != []
+        assert empty != ["QA"] and empty != (1,)
+        assert hash(empty) == hash(())
+        assert pickle.loads(pickle.dumps(empty)) is empty
+        assert json.loads(basic_result.to_json())["ai_opportunities"] == []
+
+    def test_container_arguments_are_copied(self, json_backend):
+        """Changing the list or dicts passed in afterwards does not change the result."""
+        opportunities = ["QA"]
+        metadata = {"version": "4.2"}
+        raw = {"elements": 10}
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=1.0,
+            framework="test",
+            metadata=metadata,
+            ai_opportunities=opportunities,
+            raw_analysis=raw,
+        )
+
+        opportunities.append("POISON")
+        metadata["version"] = "5.0"
+        raw["elements"] = 0
+        assert result.ai_opportunities == ["QA"] and ["QA"] == result.ai_opportunities
+        assert result.ai_opportunities != ["QA", "POISON"]
+        assert result.metadata == {"version": "4.2"}
+        assert result.raw_analysis == {"elements": 10}
+        with pytest.raises(AttributeError):
+            result.ai_opportunities.append("POISON")
+
+        assert pickle.loads(pickle.dumps(result.ai_opportunities)) == ("QA",)
+        with pytest.raises(TypeError, match="'QA'"):
+            UnifiedAnalysisResult(
+                document_type="Test", confidence=1.0, framework="test", ai_opportunities="QA"
+            )
+        assert json.loads(result.to_json())["ai_opportunities"] == ["QA"]
+        assert result.to_dict()["ai_opportunities"] == ["QA"]
+
+    def test_add_ai_opportunity(self):
+        """add_ai_opportunity() returns a copy with the opportunity appended."""
+        result = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+
+        updated = result.add_ai_opportunity("QA").add_ai_opportunity("Summarization")
+        assert updated.ai_opportunities == ["QA", "Summarization"]
+        assert result.ai_opportunities == []
+
+    def test_with_returns_modified_copy(self):
+        """with_() derives a new result and leaves the original untouched."""
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=0.5,
+            framework="test",
+            metadata={"key": "value"},
+        )
+
+        updated = result.with_(confidence=0.9)
+        assert updated is not result
+        assert updated.confidence == 0.9
+        assert updated.metadata == {"key": "value"}
+        assert result.confidence == 0.5
+
+    def test_hashable_by_identity(self):
+        """Results can be used as dict keys and set members."""
+        first = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+        second = UnifiedAnalysisResult(document_type="Test", confidence=1.0, framework="test")
+
+        assert len({first, second, first}) == 2
+        assert first != second
+
+    def test_is_mapping(self):
+        """Results are read-only mappings of field names to values."""
+        result = UnifiedAnalysisResult(
+            document_type="Test", confidence=1.0, framework="test", metadata={"key": "value"}
+        )
+
+        assert isinstance(result, Mapping)
+        assert list(result) == list(result.keys())
+        assert len(result) == 7
+        plain = dict(result)
+        assert plain["document_type"] == "Test"
+        assert plain["metadata"] is result.metadata
+        assert dict(**result) == plain
+        # Mapping's content-based equality is not inherited.
+        assert result != plain
+        assert hash(result) == object.__hash__(result)
+
+    def test_get_or_create_shares_instances(self):
+        """get_or_create() returns one live instance per set of field values."""
+        first = UnifiedAnalysisResult.get_or_create(
+            document_type="Shared", confidence=1.0, framework="test"
+        )
+        same = UnifiedAnalysisResult.get_or_create(
+            framework="test", confidence=1.0, document_type="Shared"
+        )
+        other = UnifiedAnalysisResult.get_or_create(
+            document_type="Shared", confidence=1, framework="test"
+        )
+        unhashable = UnifiedAnalysisResult.get_or_create(
+            document_type="Shared", confidence=1.0, framework="test", metadata={"k": "v"}
+        )
+
+        assert same is first
+        assert other is not first
+        assert unhashable is not UnifiedAnalysisResult.get_or_create(
+            document_type="Shared", confidence=1.0, framework="test", metadata={"k": "v"}
+        )
+        assert unhashable.metadata == {"k": "v"}
+
+        ref = weakref.ref(first)
+        del first, same
+        gc.collect()
+        assert ref() is None
+
+    def test_pickle_roundtrip(self):
+        """Results survive pickling with their field values intact."""
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=1.0,
+            framework="test",
+            metadata={"key": "value"},
+            ai_opportunities=["QA"],
+        )
+
+        restored = pickle.loads(pickle.dumps(result))
+        assert restored.to_dict() == result.to_dict()
+
+    def test_from_dict(self):
+        """from_dict() builds a result from its dict form."""
+        data: UnifiedAnalysisDict = {
+            "document_type": "Test",
+            "confidence": 0.9,
+            "framework": "test",
+            "ai_opportunities": ["QA"],
+        }
+
+        result = UnifiedAnalysisResult.from_dict(data)
+        assert result.document_type == "Test"
+        assert result.ai_opportunities == ["QA"]
+        assert UnifiedAnalysisResult.from_dict(result.to_dict()).to_dict() == result.to_dict()
+
+    def test_from_dict_unknown_key(self):
+        """from_dict() rejects keys that are not fields."""
+        with pytest.raises(TypeError):
+            UnifiedAnalysisResult.from_dict(
+                {"document_type": "Test", "confidence": 1.0, "framework": "test", "extra": 1}
+            )
+
+    def test_to_dict_copies_containers(self):
+        """to_dict() returns containers that are independent of the result."""
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=0.95,
+            framework="test",
+            metadata={"key": "value", "pages": [1, 2]},
+            ai_opportunities=["QA"],
+            raw_analysis={"stats": {"elements": 10}, "span": (0, 5)},
+        )
+
+        result_dict = result.to_dict()
+        assert list(result_dict) == list(result.keys())
+        assert result_dict["raw_analysis"] == {"stats": {"elements": 10}, "span": (0, 5)}
+
+        result_dict["metadata"]["key"] = "changed"
+        result_dict["metadata"]["pages"].append(3)
+        result_dict["ai_opportunities"].append("Summarization")
+        result_dict["raw_analysis"]["stats"]["elements"] = 0
+
+        assert result.metadata == {"key": "value", "pages": [1, 2]}
+        assert result.ai_opportunities == ["QA"]
+        assert result.raw_analysis["stats"] == {"elements": 10}
+
+    def test_to_dict_converts_nested_dataclasses(self):
+        """Dataclasses inside field values become dicts, so to_dict() is JSON-ready."""
+        chunk = ChunkInfo(chunk_id="c", content="x", metadata={"page": 1})
+        result = UnifiedAnalysisResult(
+            document_type="Test",
+            confidence=1.0,
+            framework="test",
+            raw_analysis={"chunks": [chunk]},
+        )
+
+        result_dict = result.to_dict()
+        assert result_dict["raw_analysis"]["chunks"] == [chunk.to_dict()]
+        assert type(result_dict["raw_analysis"]["chunks"][0]["metadata"]) is dict
+        assert json.loads(json.dumps(result_dict))["raw_analysis"]["chunks"][0]["chunk_id"] == "c"
+
+    def test_to_dict_with_other_mappings(self):
+        """to_dict() returns plain dicts whatever mapping type was passed in."""
+
+        class Fields(Mapping):
+            def __getitem__(self, key):
+                return {"key": "value"}[key]
+
+            def __iter__(self):
+                return iter(["key"])
+
+            def __len__(self):
+                return 1
+
+        for metadata in (Fields(), OrderedDict(key="value"), MappingProxyType({"key": "value"})):
+            result = UnifiedAnalysisResult(
+                document_type="Test", confidence=1.0, framework="test", metadata=metadata
+            )
+            copied = result.to_dict()["metadata"]
+            assert type(copied) is dict
+            assert copied == {"key": "value"}
+
+
+class TestFastInit:
+    """Test the generated __init__ helper shared by the models."""
+
+    def test_frozen_slotted_class_writes_through_slots(self):
+        """Frozen slotted classes are initialized via slot setters and stay frozen."""
+
+        @models._fast_init(interned=("name",))
+        @models._slotted
+        @dataclass(frozen=True)
+        class Record:
+            name: str
+            size: int = 0
+
+        record = Record("a", size=2)
+
+        assert "_setattr" not in Record.__init__.__code__.co_names
+        assert (record.name, record.size) == ("a", 2)
+        with pytest.raises(FrozenInstanceError):
+            record.size = 3
+
+    def test_nullable_fields(self):
+        """None selects the default or factory; a nullable field needs one of them."""
+
+        @models._fast_init(nullable=("tags", "size"))
+        @dataclass
+        class Record:
+            name: str
+            tags: list = field(default_factory=list)
+            size: int = 0
+
+        record = Record("a", tags=None, size=None)
+        assert (record.tags, record.size) == ([], 0)
+
+        with pytest.raises(ValueError, match="'name'"):
+
+            @models._fast_init(nullable=("name",))
+            @dataclass
+            class Broken:
+                name: str
+
 
 class TestChunkInfo:
     """Test ChunkInfo data model."""
@@ -166,12 +638,33 @@ class TestChunkInfo:
         assert chunk["chunk_id"] == "test_001"
         assert chunk["content"] == "Test"
 
-    def test_dict_style_access_invalid_key(self):
+    def test_dict_style_access_invalid_key(self, basic_chunk):
         """Dict-style access with invalid key raises KeyError."""
-        chunk = ChunkInfo(chunk_id="test_001", content="Test")
-
         with pytest.raises(KeyError):
-            _ = chunk["nonexistent_key"]
+            _ = basic_chunk["nonexistent_key"]
+        with pytest.raises(KeyError):
+            _ = basic_chunk["to_dict"]
+
+    def test_get_and_contains(self, basic_chunk):
+        """get() and 'in' check field names like UnifiedAnalysisResult."""
+        assert basic_chunk.get("chunk_id") == "test_001"
+        assert basic_chunk.get("nonexistent_key", "default") == "default"
+        assert basic_chunk.get("to_dict") is None
+        assert "content" in basic_chunk
+        assert "nonexistent_key" not in basic_chunk
+        assert "to_dict" not in basic_chunk
+
+    def test_keys_values_items(self, basic_chunk):
+        """keys(), values() and items() return aligned tuples of the fields."""
+        assert basic_chunk.keys() == (
+            "chunk_id",
+            "content",
+            "metadata",
+            "token_count",
+            "chunk_type",
+        )
+        assert basic_chunk.values() == ("test_001", "Test", {}, 0, "text")
+        assert basic_chunk.items() == tuple(zip(basic_chunk.keys(), basic_chunk.values()))
 
     def test_to_dict_method(self):
         """Convert to dict via to_dict()."""
@@ -191,12 +684,153 @@ class TestChunkInfo:
         assert chunk_dict["token_count"] == 10
         assert chunk_dict["chunk_type"] == "paragraph"
 
-    def test_different_chunk_types(self):
+    def test_uses_slots(self):
+        """Instances have no per-instance __dict__."""
+        chunk = ChunkInfo(chunk_id="test_001", content="Test")
+
+        assert not hasattr(chunk, "__dict__")
+        with pytest.raises(AttributeError):
+            chunk.unknown_field = "value"
+
+    def test_equality_compares_fields(self):
+        """Chunks compare by field values, only against the same class, and are unhashable."""
+        chunk = ChunkInfo(chunk_id="c1", content="a", metadata={"page": 1}, token_count=2)
+
+        assert chunk == ChunkInfo(chunk_id="c1", content="a", metadata={"page": 1}, token_count=2)
+        assert chunk != ChunkInfo(chunk_id="c1", content="a", metadata={"page": 2}, token_count=2)
+        assert chunk != chunk.to_dict()
+
+        @dataclass(frozen=True)
+        class PagedChunk(ChunkInfo):
+            pass
+
+        assert chunk != PagedChunk(**chunk.to_dict())
+        with pytest.raises(TypeError):
+            hash(chunk)
+
+    def test_chunk_type_is_interned(self):
+        """chunk_type is an interned string."""
+        chunk = ChunkInfo(chunk_id="c1", content="a", chunk_type="".join(["para", "graph"]))
+
+        assert chunk.chunk_type is sys.intern("paragraph")
+
+        class Label(str):
+            pass
+
+        # str subclasses cannot be interned and are stored unchanged.
+        labelled = ChunkInfo(chunk_id="c2", content="b", chunk_type=Label("code"))
+        assert type(labelled.chunk_type) is Label
+
+    def test_is_immutable(self):
+        """Fields cannot be reassigned and metadata is read-only."""
+        chunk = ChunkInfo(chunk_id="c1", content="a", metadata={"page": 1})
+
+        with pytest.raises(FrozenInstanceError):
+            chunk.token_count = 5
+        with pytest.raises(TypeError):
+            chunk.metadata["page"] = 2
+        with pytest.raises(TypeError):
+            ChunkInfo(chunk_id="c2", content="b").metadata["page"] = 1
+
+    def test_with_returns_modified_copy(self):
+        """with_() replaces fields on a copy and leaves the original unchanged."""
+        chunk = ChunkInfo(chunk_id="c1", content="a", token_count=2)
+
+        updated = chunk.with_(token_count=5, chunk_type="".join(["co", "de"]))
+        assert (updated.token_count, updated.chunk_type) == (5, "code")
+        assert updated.chunk_type is sys.intern("code")
+        assert chunk.token_count == 2
+
+    def test_subclass_normalizes_fields(self):
+        """Subclasses keep read-only metadata, None defaults and interning."""
+
+        @dataclass(frozen=True)
+        class PagedChunk(ChunkInfo):
+            page: int = 0
+
+        chunk = PagedChunk(
+            chunk_id="c1", content="a", metadata={"k": 1}, chunk_type="".join(["co", "de"]), page=2
+        )
+        assert chunk.page == 2
+        assert chunk.chunk_type is sys.intern("code")
+        with pytest.raises(TypeError):
+            chunk.metadata["k"] = 2
+        assert PagedChunk(chunk_id="c2", content="b", metadata=None).metadata == {}
+
+    def test_set_metadata_returns_copy(self):
+        """set_metadata() returns a new chunk and never touches the shared default."""
+        first = ChunkInfo(chunk_id="c1", content="a")
+        second = ChunkInfo(chunk_id="c2", content="b")
+        assert first.metadata is second.metadata
+
+        updated = first.set_metadata("page", 1).set_metadata("section", "Intro")
+        assert updated.metadata == {"page": 1, "section": "Intro"}
+        assert updated.chunk_id == "c1"
+        assert first.metadata == {} and second.metadata == {}
+
+    def test_none_metadata_selects_shared_default(self):
+        """metadata=None is the same as omitting it, and still supports set_metadata()."""
+        default = ChunkInfo(chunk_id="c1", content="a")
+        chunk = ChunkInfo(chunk_id="c2", content="b", metadata=None)
+
+        assert chunk.metadata is default.metadata
+        assert chunk.to_dict()["metadata"] == {}
+        assert chunk.set_metadata("page", 1).metadata == {"page": 1}
+        assert default.metadata == {}
+
+    def test_pickle_and_copy(self):
+        """Slotted chunks pickle and deep-copy, including with the shared default metadata."""
+        for chunk in (
+            ChunkInfo(chunk_id="c1", content="a"),
+            ChunkInfo(chunk_id="c2", content="b", metadata={"page": 1}, chunk_type="table"),
+        ):
+            for restored in (pickle.loads(pickle.dumps(chunk)), copy.deepcopy(chunk)):
+                assert restored == chunk
+                assert restored is not chunk
+
+    def test_from_dict(self):
+        """from_dict() builds a chunk from its dict form."""
+        data: ChunkInfoDict = {"chunk_id": "c1", "content": "text", "token_count": 3}
+
+        chunk = ChunkInfo.from_dict(data)
+        assert chunk.chunk_id == "c1"
+        assert chunk.token_count == 3
+        assert ChunkInfo.from_dict(chunk.to_dict()) == chunk
+
+    def test_json_roundtrip(self, json_backend):
+        """to_json() and from_json() round-trip a chunk."""
+        chunk = ChunkInfo(chunk_id="c1", content="text", metadata={"page": 2}, token_count=5)
+
+        assert ChunkInfo.from_json(chunk.to_json()) == chunk
+        assert ChunkInfo.from_json(chunk.to_json().decode("utf-8")) == chunk
+
+    def test_to_dict_copies_metadata(self):
+        """to_dict() returns a metadata dict that is independent of the chunk."""
+        chunk = ChunkInfo(
+            chunk_id="test_001", content="Test", metadata={"page": 1, "headings": ["Intro"]}
+        )
+
+        chunk_dict = chunk.to_dict()
+        chunk_dict["metadata"]["page"] = 2
+        chunk_dict["metadata"]["headings"].append("Scope")
+
+        assert chunk.metadata == {"page": 1, "headings": ["Intro"]}
+
+    def test_to_mapping_is_view(self):
+        """to_mapping() reads fields on access instead of copying them."""
+        chunk = ChunkInfo(chunk_id="c1", content="a", metadata={"page": 1})
+        view = chunk.to_mapping()
+
+        assert isinstance(view, Mapping) and not isinstance(view, dict)
+        assert dict(view) == dict(chunk)
+        assert view["metadata"] is chunk.metadata
+        assert "to_dict" not in view
+        with pytest.raises(KeyError):
+            view["to_dict"]
+
+    @pytest.mark.parametrize("chunk_type", ["text", "code", "table"])
+    def test_different_chunk_types(self, chunk_type):
         """Create chunks with different types."""
-        text_chunk = ChunkInfo(chunk_id="c1", content="text", chunk_type="text")
-        code_chunk = ChunkInfo(chunk_id="c2", content="code", chunk_type="code")
-        table_chunk = ChunkInfo(chunk_id="c3", content="table", chunk_type="table")
+        chunk = ChunkInfo(chunk_id="c1", content=chunk_type, chunk_type=chunk_type)
 
-        assert text_chunk.chunk_type == "text"
-        assert code_chunk.chunk_type == "code"
-        assert table_chunk.chunk_type == "table"
+        assert chunk.chunk_type == chunk_type
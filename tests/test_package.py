@@ -0,0 +1,39 @@
+"""
+Tests for the package entry point (lazy exports).
+"""
+
+import subprocess
+import sys
+
+import pytest
+import analysis_framework_base
+
+
+class TestLazyExports:
+    """Test PEP 562 lazy loading of the public API."""
+
+    def test_import_does_not_load_submodules(self):
+        """Importing the package alone does not import its submodules."""
+        code = (
+            "import sys, analysis_framework_base; "
+            "print(sorted(m for m in sys.modules if m.startswith('analysis_framework_base.')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "[]"
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ is importable from the package."""
+        for name in analysis_framework_base.__all__:
+            assert getattr(analysis_framework_base, name) is not None
+
+    def test_dir_lists_public_names(self):
+        """dir() includes names that have not been loaded yet."""
+        assert set(analysis_framework_base.__all__) <= set(dir(analysis_framework_base))
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            analysis_framework_base.DoesNotExist